@@ -0,0 +1,80 @@
+"""
+Benchmark memori: ForecastResult ringkas vs hasil dengan model statsmodels lengkap
+
+Jalankan dari root repository:
+    python benchmarks/forecast_memory.py --series 500 --periods 36
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from time_series import TimeSeriesAnalyzer  # noqa: E402
+
+
+def make_series(n_series, n_periods, seed=42):
+    """Membuat seri penjualan bulanan sintetis"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start='2022-01-31', periods=n_periods, freq='M')
+    base = rng.uniform(500, 1500, size=(n_series, 1))
+    trend = np.linspace(0, 200, n_periods)
+    noise = rng.normal(0, 50, size=(n_series, n_periods))
+    values = np.maximum(base + trend + noise, 1).round()
+
+    for row in values:
+        yield pd.DataFrame({'tanggal': dates, 'jumlah_penjualan': row})
+
+
+def measure(n_series, n_periods, keep_model):
+    """Mengukur memori yang tetap tertahan oleh hasil prediksi"""
+    gc.collect()
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+
+    results = []
+    for frame in make_series(n_series, n_periods):
+        analyzer = TimeSeriesAnalyzer(frame)
+        analyzer.prepare_data()
+        results.append((
+            analyzer.simple_exponential_smoothing(keep_model=keep_model),
+            analyzer.holt_linear_trend(keep_model=keep_model)
+        ))
+        del analyzer
+
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'keep_model': keep_model,
+        'retained_mb': (current - baseline) / (1024 * 1024),
+        'peak_mb': (peak - baseline) / (1024 * 1024),
+        'per_series_kb': (current - baseline) / 1024 / n_series
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--series', type=int, default=200, help='Jumlah seri')
+    parser.add_argument('--periods', type=int, default=36, help='Jumlah periode (bulan) per seri')
+    args = parser.parse_args()
+
+    rows = [measure(args.series, args.periods, keep_model) for keep_model in (False, True)]
+    report = pd.DataFrame(rows).set_index('keep_model')
+    print(f"{args.series} seri x {args.periods} periode (SES + Holt per seri)")
+    print(report.round(2).to_string())
+
+    compact, full = rows
+    print(f"Rasio memori tertahan (lengkap / ringkas): {full['retained_mb'] / compact['retained_mb']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,301 @@
+"""
+Load test: menjalankan pipeline dashboard untuk N sesi bersamaan secara headless
+
+Setiap sesi menjalankan tahap yang sama seperti main(): load data (dari database
+SQLite lokal pengganti MySQL), grafik, prediksi, insight, dan export. Hasilnya
+berupa laporan JSON (throughput, latensi p50/p95/p99, CPU dan perubahan RSS per
+tahap, RSS puncak) yang bisa dibandingkan antar versi.
+
+Jalankan dari root repository:
+    python benchmarks/load_test.py --sessions 8 --iterations 3 --output report.json
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from config import APP_CONFIG, PRODUCT_CATEGORIES  # noqa: E402
+from ingestion import MonthlyAggregator, get_current_rss_mb, get_peak_rss_mb  # noqa: E402
+from bulk_loader import SalesBulkLoader, create_sqlite_sales_table  # noqa: E402
+from export_jobs import ExportJobManager  # noqa: E402
+import main as app  # noqa: E402
+
+STAGES = ['load', 'charts', 'predictions', 'insights', 'export', 'export_job', 'app_run']
+
+
+def generate_synthetic_sales(n_products=20, n_outlets=5, n_months=24, seed=42):
+    """
+    Membuat data penjualan harian sintetis dengan format tabel sales_data
+
+    Args:
+        n_products (int): Jumlah produk (dibagi rata ke kategori)
+        n_outlets (int): Jumlah outlet
+        n_months (int): Panjang histori dalam bulan
+        seed (int): Seed random
+
+    Returns:
+        pd.DataFrame: Satu baris per tanggal, produk, dan outlet
+    """
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range(start='2023-01-01', periods=n_months, freq='MS')
+    days = pd.date_range(start=dates[0], end=dates[-1] + pd.offsets.MonthEnd(0), freq='D')
+
+    categories = list(PRODUCT_CATEGORIES)
+    products = pd.DataFrame({
+        'nama_produk': [f"Produk {i + 1:04d}" for i in range(n_products)],
+        'kategori_produk': [categories[i % len(categories)] for i in range(n_products)],
+        'harga_satuan': rng.choice([10000, 12000, 15000, 18000], size=n_products).astype(float),
+        'base': rng.uniform(5, 60, size=n_products)
+    })
+    outlets = [f"Outlet {i + 1:02d}" for i in range(n_outlets)]
+
+    index = pd.MultiIndex.from_product(
+        [days, range(n_products), outlets], names=['tanggal', 'produk', 'outlet']
+    ).to_frame(index=False)
+
+    day_number = (index['tanggal'] - days[0]).dt.days.to_numpy()
+    base = products['base'].to_numpy()[index['produk']]
+    seasonal = 1 + 0.2 * np.sin(2 * np.pi * day_number / 365)
+    trend = 1 + day_number / 3650
+    jumlah = rng.poisson(base * seasonal * trend)
+
+    data = pd.DataFrame({
+        'tanggal': index['tanggal'],
+        'kategori_produk': products['kategori_produk'].to_numpy()[index['produk']],
+        'nama_produk': products['nama_produk'].to_numpy()[index['produk']],
+        'outlet': index['outlet'],
+        'jumlah_penjualan': jumlah,
+        'harga_satuan': products['harga_satuan'].to_numpy()[index['produk']]
+    })
+    data['total_penjualan'] = data['jumlah_penjualan'] * data['harga_satuan']
+    return data
+
+
+def prepare_database(path, data, batch_size):
+    """Membuat database SQLite lokal dan memuat data sintetis dengan bulk loader"""
+    connection = sqlite3.connect(path)
+    create_sqlite_sales_table(connection)
+    stats = SalesBulkLoader(connection, dialect='sqlite', batch_size=batch_size).load(data)
+    connection.close()
+    return stats
+
+
+def load_monthly_from_db(path):
+    """Tahap load: baca sales_data lalu agregasi bulanan seperti ingestion"""
+    connection = sqlite3.connect(path)
+    try:
+        aggregator = MonthlyAggregator()
+        chunks = pd.read_sql_query(
+            "SELECT tanggal, kategori_produk, nama_produk, jumlah_penjualan, "
+            "harga_satuan, total_penjualan FROM sales_data",
+            connection,
+            parse_dates=['tanggal'],
+            chunksize=100_000
+        )
+        for chunk in chunks:
+            aggregator.add(chunk)
+        return aggregator.result()
+    finally:
+        connection.close()
+
+
+class StageRecorder:
+    """
+    Mengumpulkan latensi, waktu CPU, dan perubahan RSS per tahap dari banyak thread
+
+    RSS diukur untuk seluruh proses, jadi saat sesi berjalan bersamaan perubahan
+    RSS satu tahap ikut memuat alokasi sesi lain; bandingkan antar versi dengan
+    jumlah sesi yang sama.
+    """
+
+    def __init__(self):
+        self.samples = {stage: [] for stage in STAGES}
+        self.errors = {stage: 0 for stage in STAGES}
+        self.lock = threading.Lock()
+
+    def run(self, stage, func, *args, **kwargs):
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        start_rss = get_current_rss_mb()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            with self.lock:
+                self.errors[stage] += 1
+            raise
+        finally:
+            self.record(
+                stage,
+                time.perf_counter() - start_wall,
+                time.thread_time() - start_cpu,
+                get_current_rss_mb() - start_rss
+            )
+
+    def record(self, stage, wall_seconds, cpu_seconds=np.nan, rss_delta_mb=np.nan):
+        """Menambahkan satu sampel yang diukur di luar run() (mis. waktu kerja job export)"""
+        with self.lock:
+            self.samples[stage].append((wall_seconds, cpu_seconds, rss_delta_mb))
+
+    def summary(self):
+        report = {}
+        for stage, samples in self.samples.items():
+            if not samples and not self.errors[stage]:
+                continue
+            wall = np.array([s[0] for s in samples]) * 1000
+            cpu = np.array([s[1] for s in samples]) * 1000
+            rss = np.array([s[2] for s in samples])
+            report[stage] = {
+                'count': len(samples),
+                'errors': self.errors[stage],
+                'mean_ms': float(wall.mean()) if len(wall) else None,
+                'p50_ms': float(np.percentile(wall, 50)) if len(wall) else None,
+                'p95_ms': float(np.percentile(wall, 95)) if len(wall) else None,
+                'p99_ms': float(np.percentile(wall, 99)) if len(wall) else None,
+                'cpu_mean_ms': float(np.nanmean(cpu)) if np.isfinite(cpu).any() else None,
+                'rss_delta_mean_mb': float(np.nanmean(rss)) if np.isfinite(rss).any() else None,
+                'rss_delta_max_mb': float(np.nanmax(rss)) if np.isfinite(rss).any() else None
+            }
+        return report
+
+
+def run_session(recorder, db_path, export_manager, app_test, export_dedup=False):
+    """Satu sesi simulasi: urutan tahap yang sama seperti main()"""
+    data = recorder.run('load', load_monthly_from_db, db_path)
+
+    def build_charts():
+        return [app.create_visualization(data, chart_type) for chart_type in ('line', 'bar', 'area')]
+
+    recorder.run('charts', build_charts)
+
+    def predict():
+        return {category: app.perform_prediction(data, category) for category in PRODUCT_CATEGORIES}
+
+    predictions = recorder.run('predictions', predict)
+    insights = recorder.run('insights', app.generate_business_insights, predictions, data)
+
+    def export():
+        # Sama seperti UI: kirim ke antrian lalu tunggu sampai job selesai.
+        # Semua sesi meminta laporan yang identik, jadi tanpa --export-dedup setiap
+        # sesi membuat job sendiri agar N sesi benar-benar menjalankan N export
+        job = export_manager.submit(data, predictions, insights, 'excel', reuse=export_dedup)
+        while not job.finished:
+            time.sleep(0.01)
+        if job.status == 'failed':
+            raise RuntimeError(f"Export gagal: {job.error}")
+
+    # Pekerjaan dilakukan thread pekerja, jadi cpu_mean_ms tahap ini tidak mencakupnya;
+    # lama kerja tiap job dicatat terpisah sebagai tahap export_job
+    recorder.run('export', export)
+
+    if app_test:
+        from streamlit.testing.v1 import AppTest
+
+        def run_app():
+            result = AppTest.from_file(os.path.join(ROOT, 'main.py'), default_timeout=120).run()
+            if result.exception:
+                raise RuntimeError(result.exception[0].message)
+
+        # AppTest menjalankan script di thread sendiri, jadi cpu_mean_ms tahap ini tidak lengkap
+        recorder.run('app_run', run_app)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, default=4, help='Jumlah sesi bersamaan')
+    parser.add_argument('--iterations', type=int, default=3, help='Jumlah run per sesi')
+    parser.add_argument('--products', type=int, default=20, help='Jumlah produk sintetis')
+    parser.add_argument('--outlets', type=int, default=5, help='Jumlah outlet sintetis')
+    parser.add_argument('--months', type=int, default=24, help='Panjang histori (bulan)')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Batch size bulk load')
+    parser.add_argument('--app-test', action='store_true',
+                        help='Juga jalankan main() lengkap via streamlit AppTest per sesi')
+    parser.add_argument('--export-dedup', action='store_true',
+                        help='Pakai ulang job export untuk permintaan identik, seperti di aplikasi')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Path laporan JSON (default: stdout)')
+    args = parser.parse_args()
+
+    warnings.filterwarnings('ignore')
+
+    with tempfile.TemporaryDirectory(prefix='sales_loadtest_') as workdir:
+        db_path = os.path.join(workdir, 'sales.db')
+
+        data = generate_synthetic_sales(args.products, args.outlets, args.months, args.seed)
+        load_stats = prepare_database(db_path, data, args.batch_size)
+
+        recorder = StageRecorder()
+        # Satu antrian untuk semua sesi, seperti get_export_manager (st.cache_resource)
+        export_manager = ExportJobManager()
+        session_latencies = []
+        failures = 0
+
+        def session(_):
+            start = time.perf_counter()
+            run_session(recorder, db_path, export_manager, args.app_test, args.export_dedup)
+            return time.perf_counter() - start
+
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        with ThreadPoolExecutor(max_workers=args.sessions) as executor:
+            futures = [executor.submit(session, i) for i in range(args.sessions * args.iterations)]
+            for future in futures:
+                try:
+                    session_latencies.append(future.result())
+                except Exception as e:
+                    failures += 1
+                    print(f"Sesi gagal: {e}", file=sys.stderr)
+        wall = time.perf_counter() - start_wall
+        cpu = time.process_time() - start_cpu
+
+        # Satu sampel per job yang benar-benar dijalankan (tanpa waktu antre)
+        for job in export_manager.jobs.values():
+            if job.run_seconds is not None:
+                recorder.record('export_job', job.run_seconds)
+        export_manager.shutdown()
+
+    latencies = np.array(session_latencies) * 1000
+    report = {
+        'app_version': APP_CONFIG['version'],
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': vars(args),
+        'dataset': {
+            'rows': len(data),
+            'bulk_load_rows_per_second': load_stats['rows_per_second'] if load_stats else None
+        },
+        'sessions_completed': len(session_latencies),
+        'sessions_failed': failures,
+        'wall_seconds': wall,
+        'throughput_sessions_per_second': len(session_latencies) / wall if wall > 0 else None,
+        'session_latency_ms': {
+            'p50': float(np.percentile(latencies, 50)) if len(latencies) else None,
+            'p95': float(np.percentile(latencies, 95)) if len(latencies) else None,
+            'p99': float(np.percentile(latencies, 99)) if len(latencies) else None
+        },
+        'cpu_percent': cpu / wall * 100 if wall > 0 else None,
+        'peak_rss_mb': get_peak_rss_mb(),
+        'stages': recorder.summary()
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,13 +5,18 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
-import io
 import xlsxwriter
+import threading
 
 # Import modul dari folder src
-from src.config import APP_CONFIG, PRODUCT_CATEGORIES, EXPORT_CONFIG
+from src.config import APP_CONFIG, PRODUCT_CATEGORIES, EXPORT_CONFIG, INSIGHT_CONFIG, SHARED_DATA_CONFIG
 from src.connection import get_database_connection
 from src.time_series import TimeSeriesAnalyzer
+from src.ingestion import SalesFileIngestor
+from src.trend_stats import compute_trend_table
+from src.insights import build_forecast_table, evaluate_rules, rank_insights, render_insights
+from src.export_jobs import ExportJobManager, EXPORT_FORMATS, data_fingerprint
+from src.shared_dataset import SharedSalesDataset
 
 # Konfigurasi halaman
 st.set_page_config(
@@ -61,6 +66,47 @@ def load_sample_data():
     
     return pd.DataFrame(data)
 
+@st.cache_resource
+def get_shared_dataset_holder():
+    """Penampung dataset shared memory yang di-attach sekali per proses"""
+    return {'dataset': None, 'lock': threading.Lock()}
+
+def load_shared_data():
+    """Memuat data dari shared memory, beralih otomatis ke versi terbaru"""
+    holder = get_shared_dataset_holder()
+    
+    with holder['lock']:
+        dataset = holder['dataset']
+        if dataset is None:
+            dataset = SharedSalesDataset.attach()
+        else:
+            dataset = dataset.refresh()
+        holder['dataset'] = dataset
+    
+    if dataset is None:
+        return None, None, None
+    # Isi satu versi tidak pernah berubah, jadi versi + waktu publikasi cukup sebagai identitas data
+    data_key = f"shared:{dataset.version}:{dataset.manifest['created_at']}"
+    return dataset.to_frame(), dataset.version, data_key
+
+def load_uploaded_data(uploaded_file):
+    """Memproses file upload sekali per file; rerun memakai hasil bulanan yang tersimpan"""
+    cached = st.session_state.get('uploaded_data')
+    
+    if cached is None or cached['file_id'] != uploaded_file.file_id:
+        ingestor = SalesFileIngestor()
+        data = ingestor.ingest(uploaded_file)
+        cached = {
+            'file_id': uploaded_file.file_id,
+            'data': data,
+            'stats': ingestor.stats,
+            # Sidik jari dihitung sekali per file untuk identitas export
+            'data_key': data_fingerprint(data) if data is not None else None
+        }
+        st.session_state['uploaded_data'] = cached
+    
+    return cached['data'], cached['stats'], cached['data_key']
+
 def create_visualization(data, chart_type="line", product_filter="all"):
     """Membuat visualisasi data penjualan"""
     
@@ -123,7 +169,7 @@ def create_visualization(data, chart_type="line", product_filter="all"):
     
     return fig
 
-def perform_prediction(data, category):
+def perform_prediction(data, category, keep_model=False):
     """Melakukan prediksi untuk kategori produk tertentu"""
     
     # Filter data berdasarkan kategori
@@ -141,109 +187,70 @@ def perform_prediction(data, category):
         return None
     
     # Lakukan prediksi dengan kedua metode
-    ses_result = analyzer.simple_exponential_smoothing()
-    holt_result = analyzer.holt_linear_trend()
-    
-    # Analisis tren
-    trend_analysis = analyzer.get_trend_analysis()
+    ses_result = analyzer.simple_exponential_smoothing(keep_model=keep_model)
+    holt_result = analyzer.holt_linear_trend(keep_model=keep_model)
     
     return {
         'ses': ses_result,
-        'holt': holt_result,
-        'trend': trend_analysis,
-        'historical_data': monthly_data
+        'holt': holt_result
     }
 
-def generate_business_insights(predictions):
+def generate_business_insights(predictions, data, top_n=None, trend_table=None):
     """Menghasilkan insight bisnis berdasarkan prediksi"""
     
-    insights = {
-        'inventory': [],
-        'marketing': [],
-        'production': [],
-        'financial': []
-    }
+    # Tabel kolumnar: forecast, metrik tren (tabel yang sama dengan UI), dan harga per seri
+    forecast_table = build_forecast_table(predictions, data, trend_table=trend_table)
     
-    for category, pred_data in predictions.items():
-        if pred_data and pred_data['holt']:
-            forecast = pred_data['holt']['forecast']
-            trend = pred_data['trend']
-            
-            category_name = PRODUCT_CATEGORIES[category]
-            
-            # Inventory Management
-            avg_forecast = forecast.mean()
-            if trend['direction'] == 'Naik':
-                insights['inventory'].append(
-                    f"Tingkatkan stok {category_name} sebesar 20-30% untuk mengantisipasi peningkatan permintaan"
-                )
-            elif trend['direction'] == 'Turun':
-                insights['inventory'].append(
-                    f"Kurangi stok {category_name} dan fokus pada produk dengan performa lebih baik"
-                )
-            
-            # Marketing Strategy
-            if trend['volatilitas'] > 20:
-                insights['marketing'].append(
-                    f"Implementasikan strategi pemasaran yang lebih agresif untuk {category_name} karena volatilitas tinggi"
-                )
-            
-            # Production Planning
-            insights['production'].append(
-                f"Rencanakan produksi {category_name} sebesar {int(avg_forecast)} unit per bulan untuk 2 bulan ke depan"
-            )
-            
-            # Financial Forecasting
-            if category == 'kopi_susu':
-                revenue_forecast = avg_forecast * 15000
-            else:
-                revenue_forecast = avg_forecast * 12000
-            
-            insights['financial'].append(
-                f"Proyeksi pendapatan {category_name}: Rp {revenue_forecast:,.0f} per bulan"
-            )
+    # Evaluasi aturan secara vektor, lalu render hanya insight teratas
+    hits = rank_insights(evaluate_rules(forecast_table), top_n=top_n)
     
-    return insights
+    return render_insights(hits, forecast_table)
 
-def export_to_excel(data, predictions, insights):
-    """Export data ke Excel"""
-    
-    output = io.BytesIO()
-    
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        # Sheet 1: Data Historis
-        data.to_excel(writer, sheet_name='Data Historis', index=False)
-        
-        # Sheet 2: Hasil Prediksi
-        prediction_data = []
-        for category, pred_data in predictions.items():
-            if pred_data and pred_data['holt']:
-                forecast = pred_data['holt']['forecast']
-                dates = pd.date_range(start='2025-04-01', periods=len(forecast), freq='M')
-                
-                for i, (date, value) in enumerate(zip(dates, forecast)):
-                    prediction_data.append({
-                        'Tanggal': date,
-                        'Kategori': PRODUCT_CATEGORIES[category],
-                        'Prediksi (Unit)': int(value),
-                        'Metode': 'Holt Linear Trend'
-                    })
-        
-        pd.DataFrame(prediction_data).to_excel(writer, sheet_name='Hasil Prediksi', index=False)
-        
-        # Sheet 3: Insight Bisnis
-        insight_data = []
-        for category, insight_list in insights.items():
-            for insight in insight_list:
-                insight_data.append({
-                    'Kategori': category.title(),
-                    'Insight': insight
-                })
-        
-        pd.DataFrame(insight_data).to_excel(writer, sheet_name='Insight Bisnis', index=False)
-    
-    output.seek(0)
-    return output
+@st.cache_resource
+def get_export_manager():
+    """Antrian export bersama untuk semua sesi dalam proses ini"""
+    return ExportJobManager()
+
+@st.fragment(run_every=EXPORT_CONFIG['poll_interval_seconds'])
+def poll_export_progress(manager, job_id):
+    """Memeriksa progres export secara berkala tanpa menjalankan ulang seluruh halaman"""
+    job = manager.get(job_id)
+    if job is None or job.finished:
+        st.rerun()
+    st.progress(job.progress, text=f"Menyiapkan laporan... {job.progress:.0%}")
+
+def clear_export_job():
+    """Melupakan job export sesi ini beserta artefak yang tersimpan"""
+    for key in ('export_job_id', 'export_source_key', 'export_artifact'):
+        st.session_state.pop(key, None)
+
+def get_export_artifact(manager, job):
+    """Membaca artefak sekali per job lalu menyimpannya di sesi"""
+    cached = st.session_state.get('export_artifact')
+    if cached is None or cached['job_id'] != job.job_id:
+        cached = {'job_id': job.job_id, 'data': manager.read_artifact(job)}
+        st.session_state['export_artifact'] = cached
+    return cached['data']
+
+def render_export_status(manager, job_id):
+    """Menampilkan status job export dan tombol download jika sudah siap"""
+    job = manager.get(job_id)
+    artifact = get_export_artifact(manager, job) if job is not None and job.status == 'done' else None
+    
+    if job is None or (job.status == 'done' and artifact is None):
+        st.info("Laporan sudah kedaluwarsa. Silakan buat ulang.")
+        clear_export_job()
+    elif job.status == 'done':
+        st.download_button(
+            label="📊 Download Laporan Lengkap",
+            data=artifact,
+            file_name=job.file_name,
+            mime=job.mime
+        )
+    elif job.status == 'failed':
+        st.error(f"Gagal membuat laporan: {job.error}")
+    else:
+        poll_export_progress(manager, job_id)
 
 def main():
     """Fungsi utama aplikasi"""
@@ -259,13 +266,45 @@ def main():
     # Pilihan sumber data
     data_source = st.sidebar.selectbox(
         "Sumber Data",
-        ["Data Contoh", "Database MySQL"]
+        ["Data Contoh", "Unggah File (CSV/Excel)", "Database MySQL"]
+        + (["Data Bersama (Shared Memory)"] if SHARED_DATA_CONFIG['enabled'] else [])
     )
     
+    # Identitas data untuk export, dihitung sekali saat data dimuat
+    # (None = data contoh, di-hash hanya saat laporan diminta)
+    data_key = None
+    
     # Load data
     if data_source == "Data Contoh":
         data = load_sample_data()
         st.sidebar.success("Data contoh berhasil dimuat")
+    elif data_source == "Data Bersama (Shared Memory)":
+        data, version, data_key = load_shared_data()
+        if data is not None:
+            st.sidebar.success(f"Data bersama versi {version} berhasil dimuat")
+        else:
+            st.sidebar.error("Data bersama belum dipublikasikan. Menggunakan data contoh.")
+            data = load_sample_data()
+    elif data_source == "Unggah File (CSV/Excel)":
+        uploaded_file = st.sidebar.file_uploader(
+            "File Penjualan Harian",
+            type=["csv", "xlsx"],
+            help="Maksimal 200 MB. File lebih besar diproses dari server (lihat README)."
+        )
+        data = None
+        if uploaded_file is not None:
+            data, stats, data_key = load_uploaded_data(uploaded_file)
+            if data is not None:
+                st.sidebar.success(f"{stats['rows_valid']:,} baris berhasil diproses")
+                st.sidebar.caption(
+                    f"{stats['rows_per_second']:,.0f} baris/detik | "
+                    f"RSS +{stats['rss_growth_mb']:,.0f} MB "
+                    f"(puncak proses {stats['process_peak_rss_mb']:,.0f} MB) | "
+                    f"{stats['rows_invalid']:,} baris tidak valid"
+                )
+        if data is None:
+            st.sidebar.info("Belum ada file valid. Menggunakan data contoh.")
+            data = load_sample_data()
     else:
         # Coba koneksi database
         db = get_database_connection()
@@ -317,6 +356,10 @@ def main():
         # Lakukan prediksi untuk setiap kategori
         predictions = {}
         
+        # Statistik tren semua kategori dihitung sekali, dipakai UI dan insight
+        trend_table = compute_trend_table(data)
+        trends = trend_table.set_index('key')
+        
         for category in ['kopi_susu', 'non_kopi']:
             with st.expander(f"Prediksi {PRODUCT_CATEGORIES[category]}"):
                 pred_result = perform_prediction(data, category)
@@ -326,16 +369,16 @@ def main():
                     
                     # Tampilkan hasil prediksi Holt
                     if pred_result['holt']:
-                        holt_forecast = pred_result['holt']['forecast']
-                        mape = pred_result['holt']['mape']
+                        holt_forecast = pred_result['holt'].forecast
+                        mape = pred_result['holt'].mape
                         
                         st.metric(
                             "Prediksi April 2025",
-                            f"{int(holt_forecast.iloc[0])} unit"
+                            f"{int(holt_forecast[0])} unit"
                         )
                         st.metric(
                             "Prediksi Mei 2025",
-                            f"{int(holt_forecast.iloc[1])} unit"
+                            f"{int(holt_forecast[1])} unit"
                         )
                         st.metric(
                             "Akurasi (MAPE)",
@@ -343,7 +386,7 @@ def main():
                         )
                         
                         # Analisis tren
-                        trend = pred_result['trend']
+                        trend = trends.loc[category]
                         st.write(f"**Tren:** {trend['direction']} ({trend['strength']})")
                         st.write(f"**Volatilitas:** {trend['volatility']:.1f}%")
                 else:
@@ -354,7 +397,9 @@ def main():
     st.subheader("💡 Insight Bisnis Strategis")
     
     if predictions:
-        insights = generate_business_insights(predictions)
+        insights = generate_business_insights(
+            predictions, data, top_n=INSIGHT_CONFIG['top_n'], trend_table=trend_table
+        )
         
         insight_tabs = st.tabs(["📦 Inventory", "📈 Marketing", "🏭 Produksi", "💰 Keuangan"])
         
@@ -378,17 +423,33 @@ def main():
     st.markdown("---")
     st.subheader("📥 Export Data")
     
-    if st.button("Download Laporan Excel"):
+    export_format = st.selectbox(
+        "Format Laporan",
+        list(EXPORT_FORMATS),
+        format_func=lambda x: EXPORT_FORMATS[x]['label']
+    )
+    
+    export_manager = get_export_manager()
+    source_key = data_key or data_source
+    
+    # Job lama tidak berlaku lagi jika data sudah berubah (sumber, file, atau versi lain)
+    if st.session_state.get('export_source_key') not in (None, source_key):
+        clear_export_job()
+    
+    if st.button("Buat Laporan"):
         if predictions:
-            excel_data = export_to_excel(data, predictions, insights)
-            st.download_button(
-                label="📊 Download Laporan Lengkap",
-                data=excel_data,
-                file_name=EXPORT_CONFIG['excel_filename'],
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            # Insight lengkap (tanpa top-N) untuk laporan
+            export_insights = generate_business_insights(predictions, data, trend_table=trend_table)
+            job = export_manager.submit(
+                data, predictions, export_insights, export_format, data_key=data_key
             )
+            st.session_state['export_job_id'] = job.job_id
+            st.session_state['export_source_key'] = source_key
         else:
             st.error("Tidak ada data prediksi untuk di-export")
+    
+    if 'export_job_id' in st.session_state:
+        render_export_status(export_manager, st.session_state['export_job_id'])
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,289 @@
+import csv
+import os
+import tempfile
+import time
+import pandas as pd
+import numpy as np
+import streamlit as st
+from config import BULK_LOAD_CONFIG
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - pyarrow opsional
+    pa = None
+
+# Kolom yang ditulis ke tabel sales_data (id dan timestamp diisi database)
+SALES_COLUMNS = [
+    'tanggal', 'kategori_produk', 'nama_produk', 'outlet',
+    'jumlah_penjualan', 'harga_satuan', 'total_penjualan'
+]
+
+# Kunci alami untuk deduplikasi: satu baris per tanggal, produk, dan outlet
+NATURAL_KEY = ['tanggal', 'nama_produk', 'outlet']
+
+UPDATE_COLUMNS = [col for col in SALES_COLUMNS if col not in NATURAL_KEY]
+
+# Index sekunder yang boleh di-drop dan dibangun ulang saat load besar
+SECONDARY_INDEXES = {
+    'idx_sales_kategori_tanggal': ['kategori_produk', 'tanggal']
+}
+
+# Skema pengganti untuk SQLite (database lokal untuk pengujian)
+SQLITE_SALES_TABLE = """
+    CREATE TABLE IF NOT EXISTS sales_data (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        tanggal DATE NOT NULL,
+        kategori_produk TEXT NOT NULL CHECK (kategori_produk IN ('kopi_susu', 'non_kopi')),
+        nama_produk VARCHAR(255) NOT NULL,
+        outlet VARCHAR(100) NOT NULL DEFAULT '',
+        jumlah_penjualan INT NOT NULL,
+        harga_satuan DECIMAL(10,2) NOT NULL,
+        total_penjualan DECIMAL(12,2) NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE (tanggal, nama_produk, outlet)
+    )
+"""
+
+
+def create_sqlite_sales_table(connection):
+    """
+    Membuat tabel sales_data beserta index sekunder pada koneksi SQLite
+
+    Args:
+        connection (sqlite3.Connection): Koneksi SQLite
+    """
+    cursor = connection.cursor()
+    cursor.execute(SQLITE_SALES_TABLE)
+    for name, columns in SECONDARY_INDEXES.items():
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON sales_data ({', '.join(columns)})")
+    connection.commit()
+    cursor.close()
+
+
+class SalesBulkLoader:
+    def __init__(self, connection, dialect='mysql', batch_size=None, table='sales_data'):
+        """
+        Inisialisasi bulk loader untuk tabel sales_data
+
+        Args:
+            connection: Koneksi DB-API (mysql.connector atau sqlite3)
+            dialect (str): 'mysql' atau 'sqlite'
+            batch_size (int): Jumlah baris per batch (satu commit per batch)
+            table (str): Nama tabel tujuan
+        """
+        if dialect not in ('mysql', 'sqlite'):
+            raise ValueError(f"Dialect tidak didukung: {dialect}")
+        if batch_size is None:
+            batch_size = BULK_LOAD_CONFIG['batch_size']
+
+        self.connection = connection
+        self.dialect = dialect
+        self.batch_size = batch_size
+        self.table = table
+        self.stats = {}
+
+    def upsert_query(self):
+        """Query INSERT multi-baris dengan upsert pada kunci alami"""
+        columns = ', '.join(SALES_COLUMNS)
+
+        if self.dialect == 'mysql':
+            placeholders = ', '.join(['%s'] * len(SALES_COLUMNS))
+            updates = ', '.join(f"{col} = VALUES({col})" for col in UPDATE_COLUMNS)
+            return (
+                f"INSERT INTO {self.table} ({columns}) VALUES ({placeholders}) "
+                f"ON DUPLICATE KEY UPDATE {updates}"
+            )
+
+        placeholders = ', '.join(['?'] * len(SALES_COLUMNS))
+        updates = ', '.join(f"{col} = excluded.{col}" for col in UPDATE_COLUMNS)
+        return (
+            f"INSERT INTO {self.table} ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT ({', '.join(NATURAL_KEY)}) DO UPDATE SET {updates}"
+        )
+
+    def prepare_batch(self, frame):
+        """
+        Menyiapkan satu batch: kolom lengkap, tipe sesuai skema, tanpa duplikat kunci
+
+        Args:
+            frame (pd.DataFrame): Data penjualan mentah
+
+        Returns:
+            pd.DataFrame: Batch siap ditulis
+        """
+        frame = frame.rename(columns=lambda c: str(c).strip().lower())
+
+        if 'outlet' not in frame.columns:
+            frame = frame.assign(outlet='')
+        if 'total_penjualan' not in frame.columns:
+            frame = frame.assign(total_penjualan=frame['jumlah_penjualan'] * frame['harga_satuan'])
+
+        batch = frame[SALES_COLUMNS].copy()
+        batch['tanggal'] = pd.to_datetime(batch['tanggal']).dt.strftime('%Y-%m-%d')
+        batch['kategori_produk'] = batch['kategori_produk'].astype(str)
+        batch['outlet'] = batch['outlet'].fillna('').astype(str)
+        batch['jumlah_penjualan'] = batch['jumlah_penjualan'].astype('int64')
+        batch['harga_satuan'] = batch['harga_satuan'].astype('float64').round(2)
+        batch['total_penjualan'] = batch['total_penjualan'].astype('float64').round(2)
+
+        # Baris terakhir menang, sama seperti upsert di database
+        return batch.drop_duplicates(subset=NATURAL_KEY, keep='last')
+
+    def iter_batches(self, source):
+        """
+        Memecah sumber data menjadi DataFrame berukuran batch_size
+
+        Args:
+            source: DataFrame, pyarrow Table/RecordBatch, atau iterable dari keduanya
+
+        Yields:
+            pd.DataFrame: Batch data
+        """
+        if isinstance(source, pd.DataFrame):
+            for start in range(0, len(source), self.batch_size):
+                yield source.iloc[start:start + self.batch_size]
+        elif pa is not None and isinstance(source, pa.Table):
+            for record_batch in source.to_batches(max_chunksize=self.batch_size):
+                yield record_batch.to_pandas()
+        elif pa is not None and isinstance(source, pa.RecordBatch):
+            yield from self.iter_batches(pa.Table.from_batches([source]))
+        else:
+            for part in source:
+                yield from self.iter_batches(part)
+
+    def _count_rows(self, source):
+        """
+        Menghitung jumlah baris sumber tanpa mengonsumsinya
+
+        Returns:
+            int: Jumlah baris, atau None jika sumber berupa iterator/generator
+        """
+        if isinstance(source, pd.DataFrame):
+            return len(source)
+        if pa is not None and isinstance(source, (pa.Table, pa.RecordBatch)):
+            return source.num_rows
+        if isinstance(source, (list, tuple)):
+            counts = [self._count_rows(part) for part in source]
+            return None if None in counts else sum(counts)
+        return None
+
+    def _write_executemany(self, cursor, batch):
+        """Menulis batch dengan executemany (INSERT multi-baris)"""
+        rows = list(batch.astype(object).itertuples(index=False, name=None))
+        cursor.executemany(self.upsert_query(), rows)
+
+    def _write_load_data(self, cursor, batch):
+        """
+        Menulis batch melalui LOAD DATA LOCAL INFILE (khusus MySQL)
+
+        Koneksi harus dibuat dengan allow_local_infile=True. Berbeda dengan
+        ON DUPLICATE KEY UPDATE, REPLACE menghapus baris dengan kunci alami yang
+        sama lalu menyisipkannya ulang, sehingga id dan created_at ikut berubah.
+        """
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        try:
+            with os.fdopen(handle, 'w', newline='', encoding='utf-8') as f:
+                batch.to_csv(f, index=False, header=False, quoting=csv.QUOTE_MINIMAL)
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE %s REPLACE INTO TABLE {self.table} "
+                "CHARACTER SET utf8mb4 FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                f"LINES TERMINATED BY '\\n' ({', '.join(SALES_COLUMNS)})",
+                (path,)
+            )
+        finally:
+            os.remove(path)
+
+    def drop_secondary_indexes(self):
+        """Menghapus index sekunder sebelum load besar"""
+        cursor = self.connection.cursor()
+        for name in SECONDARY_INDEXES:
+            if self.dialect == 'mysql':
+                cursor.execute(f"ALTER TABLE {self.table} DROP INDEX {name}")
+            else:
+                cursor.execute(f"DROP INDEX IF EXISTS {name}")
+        self.connection.commit()
+        cursor.close()
+
+    def create_secondary_indexes(self):
+        """Membangun ulang index sekunder setelah load besar"""
+        cursor = self.connection.cursor()
+        for name, columns in SECONDARY_INDEXES.items():
+            cursor.execute(f"CREATE INDEX {name} ON {self.table} ({', '.join(columns)})")
+        self.connection.commit()
+        cursor.close()
+
+    def load(self, source, method='executemany', rebuild_indexes=None):
+        """
+        Memuat data ke sales_data per batch dengan upsert pada kunci alami
+
+        Args:
+            source: DataFrame, pyarrow Table/RecordBatch, atau iterable dari keduanya
+                (mis. SalesFileIngestor.iter_chunks)
+            method (str): 'executemany' (upsert, id dan created_at dipertahankan) atau
+                'load_data' (LOAD DATA LOCAL INFILE REPLACE, MySQL; id dan created_at baru)
+            rebuild_indexes (bool): Drop index sekunder selama load lalu bangun ulang.
+                None = otomatis jika jumlah baris sumber melebihi ambang konfigurasi
+                (sumber berupa generator tidak dihitung)
+
+        Returns:
+            dict: Statistik load (rows, batches, elapsed_seconds, rows_per_second),
+                atau None jika gagal
+        """
+        if method not in ('executemany', 'load_data'):
+            raise ValueError(f"Metode load tidak didukung: {method}")
+        if method == 'load_data' and self.dialect != 'mysql':
+            raise ValueError("LOAD DATA LOCAL INFILE hanya tersedia untuk MySQL")
+
+        if rebuild_indexes is None:
+            total_rows = self._count_rows(source)
+            rebuild_indexes = (
+                total_rows is not None
+                and total_rows >= BULK_LOAD_CONFIG['rebuild_indexes_threshold']
+            )
+
+        write = self._write_executemany if method == 'executemany' else self._write_load_data
+        self.stats = {'rows': 0, 'duplicates': 0, 'batches': 0}
+        start = time.perf_counter()
+        indexes_dropped = False
+        cursor = None
+
+        try:
+            if rebuild_indexes:
+                self.drop_secondary_indexes()
+                indexes_dropped = True
+
+            cursor = self.connection.cursor()
+            for frame in self.iter_batches(source):
+                batch = self.prepare_batch(frame)
+                write(cursor, batch)
+                # Satu commit per batch
+                self.connection.commit()
+
+                self.stats['rows'] += len(batch)
+                self.stats['duplicates'] += len(frame) - len(batch)
+                self.stats['batches'] += 1
+
+            cursor.close()
+            cursor = None
+
+            if indexes_dropped:
+                self.create_secondary_indexes()
+                indexes_dropped = False
+
+            elapsed = time.perf_counter() - start
+            self.stats['elapsed_seconds'] = elapsed
+            self.stats['rows_per_second'] = self.stats['rows'] / elapsed if elapsed > 0 else np.nan
+            return self.stats
+
+        except Exception as e:
+            self.connection.rollback()
+            if cursor is not None:
+                cursor.close()
+            if indexes_dropped:
+                try:
+                    self.create_secondary_indexes()
+                except Exception as index_error:
+                    st.error(f"Error membangun ulang index sekunder: {index_error}")
+            st.error(f"Error dalam bulk load sales_data: {e}")
+            return None
@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 # Database Configuration
 DATABASE_CONFIG = {
@@ -6,7 +7,8 @@ DATABASE_CONFIG = {
     'user': os.getenv('DB_USER', 'root'),
     'password': os.getenv('DB_PASSWORD', ''),
     'database': os.getenv('DB_NAME', 'sales_prediction'),
-    'port': int(os.getenv('DB_PORT', 3306))
+    'port': int(os.getenv('DB_PORT', 3306)),
+    'allow_local_infile': os.getenv('DB_ALLOW_LOCAL_INFILE', '0') == '1'
 }
 
 # Application Configuration
@@ -31,9 +33,50 @@ PRODUCT_CATEGORIES = {
     'non_kopi': 'Non-Kopi Botolan'
 }
 
+# Ingestion Configuration
+INGESTION_CONFIG = {
+    'chunk_size': 200_000,  # Jumlah baris per chunk saat membaca file upload
+    'csv_block_size': 16 * 1024 * 1024,  # Ukuran blok (byte) untuk pembaca CSV pyarrow
+    'use_pyarrow': True,
+    'date_format': None  # None = deteksi otomatis format tanggal
+}
+
+# Bulk Load Configuration
+BULK_LOAD_CONFIG = {
+    'batch_size': 5000,  # Jumlah baris per INSERT multi-baris (satu commit per batch)
+    'rebuild_indexes_threshold': 500_000  # Drop & bangun ulang index sekunder di atas jumlah baris ini
+}
+
+# Shared Memory Dataset Configuration
+SHARED_DATA_CONFIG = {
+    'enabled': os.getenv('SHARED_DATASET', '0') == '1',
+    'manifest_dir': os.getenv('SHARED_DATASET_DIR', os.path.join(tempfile.gettempdir(), 'sales_shared')),
+    'name_prefix': 'sales'  # Awalan nama blok shared memory
+}
+
+# Skema kolom tabel sales_data yang wajib ada pada file upload
+SALES_DATA_COLUMNS = {
+    'tanggal': 'datetime64[ns]',
+    'kategori_produk': 'category',
+    'nama_produk': 'string',
+    'jumlah_penjualan': 'int64',
+    'harga_satuan': 'float64'
+}
+
+# Insight Configuration
+INSIGHT_CONFIG = {
+    'top_n': 5,  # Jumlah insight teratas per area yang ditampilkan di UI
+    'volatility_threshold': 20  # Volatilitas (%) di atas nilai ini dianggap tinggi
+}
+
 # Export Configuration
 EXPORT_CONFIG = {
     'excel_filename': 'laporan_prediksi_permintaan.xlsx',
+    'csv_filename': 'laporan_prediksi_permintaan_csv.zip',
+    'parquet_filename': 'laporan_prediksi_permintaan_parquet.zip',
+    'max_workers': 2,  # Jumlah thread pembuat laporan di background
+    'job_ttl_seconds': 30 * 60,  # Artefak laporan dihapus 30 menit setelah selesai
+    'poll_interval_seconds': 1,  # Interval UI memeriksa progres export
     'sheets': {
         'data_historis': 'Data Historis',
         'prediksi': 'Hasil Prediksi',
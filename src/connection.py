@@ -2,6 +2,7 @@ import mysql.connector
 from mysql.connector import Error
 import streamlit as st
 from config import DATABASE_CONFIG
+from bulk_loader import SalesBulkLoader
 
 class DatabaseConnection:
     def __init__(self):
@@ -18,7 +19,8 @@ class DatabaseConnection:
                     'user': st.secrets['mysql']['user'],
                     'password': st.secrets['mysql']['password'],
                     'database': st.secrets['mysql']['database'],
-                    'port': st.secrets['mysql']['port']
+                    'port': st.secrets['mysql']['port'],
+                    'allow_local_infile': st.secrets['mysql'].get('allow_local_infile', False)
                 }
             else:
                 # Fallback ke konfigurasi default
@@ -64,6 +66,11 @@ class DatabaseConnection:
             st.error(f"Error menjalankan insert: {e}")
             return False
     
+    def bulk_load_sales(self, source, batch_size=None, method='executemany', rebuild_indexes=None):
+        """Memuat DataFrame/Arrow batch ke sales_data dengan upsert per batch"""
+        loader = SalesBulkLoader(self.connection, dialect='mysql', batch_size=batch_size)
+        return loader.load(source, method=method, rebuild_indexes=rebuild_indexes)
+    
     def create_tables(self):
         """Membuat tabel-tabel yang diperlukan"""
         tables = {
@@ -73,11 +80,14 @@ class DatabaseConnection:
                     tanggal DATE NOT NULL,
                     kategori_produk ENUM('kopi_susu', 'non_kopi') NOT NULL,
                     nama_produk VARCHAR(255) NOT NULL,
+                    outlet VARCHAR(100) NOT NULL DEFAULT '',
                     jumlah_penjualan INT NOT NULL,
                     harga_satuan DECIMAL(10,2) NOT NULL,
                     total_penjualan DECIMAL(12,2) NOT NULL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                    UNIQUE KEY uq_sales_tanggal_produk_outlet (tanggal, nama_produk, outlet),
+                    INDEX idx_sales_kategori_tanggal (kategori_produk, tanggal)
                 )
             """,
             'predictions': """
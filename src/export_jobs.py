@@ -0,0 +1,306 @@
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import numpy as np
+from config import EXPORT_CONFIG, PRODUCT_CATEGORIES
+
+# Format laporan yang didukung
+EXPORT_FORMATS = {
+    'excel': {
+        'label': 'Excel (.xlsx)',
+        'file_name': EXPORT_CONFIG['excel_filename'],
+        'extension': '.xlsx',
+        'mime': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+    },
+    'csv': {
+        'label': 'CSV (.zip)',
+        'file_name': EXPORT_CONFIG['csv_filename'],
+        'extension': '.zip',
+        'mime': 'application/zip'
+    },
+    'parquet': {
+        'label': 'Parquet (.zip)',
+        'file_name': EXPORT_CONFIG['parquet_filename'],
+        'extension': '.zip',
+        'mime': 'application/zip'
+    }
+}
+
+
+def build_report_tables(data, predictions, insights):
+    """
+    Menyusun tabel-tabel laporan (satu DataFrame per sheet)
+
+    Args:
+        data (pd.DataFrame): Data historis
+        predictions (dict): Hasil perform_prediction per kategori
+        insights (dict): Daftar teks insight per area
+
+    Returns:
+        dict: Nama sheet -> DataFrame
+    """
+    sheets = EXPORT_CONFIG['sheets']
+
+    prediction_frames = []
+    for category, pred_data in predictions.items():
+        if pred_data and pred_data['holt']:
+            holt = pred_data['holt']
+            prediction_frames.append(pd.DataFrame({
+                'Tanggal': pd.date_range(start='2025-04-01', periods=len(holt.forecast), freq='M'),
+                'Kategori': PRODUCT_CATEGORIES.get(category, category),
+                'Prediksi (Unit)': holt.forecast.astype(int),
+                'Batas Bawah': holt.lower.round(2),
+                'Batas Atas': holt.upper.round(2),
+                'Metode': holt.method
+            }))
+
+    insight_data = [
+        {'Kategori': area.title(), 'Insight': insight}
+        for area, insight_list in insights.items()
+        for insight in insight_list
+    ]
+
+    return {
+        sheets['data_historis']: data,
+        sheets['prediksi']: (
+            pd.concat(prediction_frames, ignore_index=True) if prediction_frames else pd.DataFrame()
+        ),
+        sheets['insight']: pd.DataFrame(insight_data, columns=['Kategori', 'Insight'])
+    }
+
+
+def write_excel(tables, path, progress):
+    """Menulis semua tabel sebagai sheet Excel"""
+    with pd.ExcelWriter(path, engine='xlsxwriter') as writer:
+        for i, (sheet_name, table) in enumerate(tables.items(), start=1):
+            table.to_excel(writer, sheet_name=sheet_name, index=False)
+            progress(i / (len(tables) + 1))
+
+
+def write_csv_zip(tables, path, progress):
+    """Menulis setiap tabel sebagai file CSV di dalam arsip zip"""
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for i, (sheet_name, table) in enumerate(tables.items(), start=1):
+            archive.writestr(f"{sheet_name}.csv", table.to_csv(index=False))
+            progress(i / (len(tables) + 1))
+
+
+def write_parquet_zip(tables, path, progress):
+    """Menulis setiap tabel sebagai file Parquet di dalam arsip zip"""
+    with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for i, (sheet_name, table) in enumerate(tables.items(), start=1):
+            buffer = io.BytesIO()
+            table.to_parquet(buffer, index=False)
+            archive.writestr(f"{sheet_name}.parquet", buffer.getvalue())
+            progress(i / (len(tables) + 1))
+
+
+WRITERS = {
+    'excel': write_excel,
+    'csv': write_csv_zip,
+    'parquet': write_parquet_zip
+}
+
+
+def data_fingerprint(data):
+    """
+    Menghitung sidik jari data historis
+
+    Returns:
+        str: Hash SHA-256 heksadesimal
+    """
+    return hashlib.sha256(
+        pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes()
+    ).hexdigest()
+
+
+def request_fingerprint(data, predictions, insights, export_format, data_key=None):
+    """
+    Menghitung sidik jari permintaan export agar permintaan identik memakai artefak yang sama
+
+    Args:
+        data_key (str): Identitas data yang sudah diketahui (mis. data_fingerprint yang
+            disimpan saat data dimuat); jika None, isi data di-hash
+
+    Returns:
+        str: Hash SHA-256 heksadesimal
+    """
+    if data_key is None:
+        data_key = data_fingerprint(data)
+
+    digest = hashlib.sha256(export_format.encode())
+    digest.update(data_key.encode())
+    for category in sorted(predictions):
+        pred_data = predictions[category]
+        if pred_data and pred_data['holt']:
+            digest.update(category.encode())
+            digest.update(np.ascontiguousarray(pred_data['holt'].forecast).tobytes())
+    digest.update(json.dumps(insights, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class ExportJob:
+    """Status satu pekerjaan export"""
+
+    def __init__(self, job_id, key, export_format):
+        self.job_id = job_id
+        self.key = key
+        self.export_format = export_format
+        self.status = 'pending'  # pending, running, done, failed
+        self.progress = 0.0
+        self.path = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        return self.status in ('done', 'failed')
+
+    @property
+    def run_seconds(self):
+        """Lama export dikerjakan pekerja (tanpa waktu antre), None jika belum selesai"""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    @property
+    def file_name(self):
+        return EXPORT_FORMATS[self.export_format]['file_name']
+
+    @property
+    def mime(self):
+        return EXPORT_FORMATS[self.export_format]['mime']
+
+
+class ExportJobManager:
+    def __init__(self, max_workers=None, ttl_seconds=None, directory=None):
+        """
+        Inisialisasi antrian export di background
+
+        Args:
+            max_workers (int): Jumlah thread pekerja
+            ttl_seconds (int): Lama artefak disimpan setelah selesai
+            directory (str): Folder penyimpanan artefak (default folder temp baru)
+        """
+        if max_workers is None:
+            max_workers = EXPORT_CONFIG['max_workers']
+        if ttl_seconds is None:
+            ttl_seconds = EXPORT_CONFIG['job_ttl_seconds']
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix='sales_export_')
+
+        self.ttl_seconds = ttl_seconds
+        self.directory = directory
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='export')
+        self.jobs = {}
+        self.jobs_by_key = {}
+        self.lock = threading.Lock()
+
+    def submit(self, data, predictions, insights, export_format='excel', reuse=True, data_key=None):
+        """
+        Mengirim permintaan export ke antrian; permintaan identik memakai job yang sama
+
+        Args:
+            reuse (bool): False untuk selalu membuat job baru meski permintaannya identik
+            data_key (str): Identitas data yang sudah dihitung, lihat request_fingerprint
+
+        Returns:
+            ExportJob: Job baru atau job yang sudah ada untuk permintaan yang sama
+        """
+        if export_format not in WRITERS:
+            raise ValueError(f"Format export tidak didukung: {export_format}")
+
+        key = request_fingerprint(data, predictions, insights, export_format, data_key)
+
+        with self.lock:
+            self._cleanup_expired()
+            existing = self.jobs_by_key.get(key)
+            if reuse and existing is not None and existing.status != 'failed':
+                return existing
+
+            job = ExportJob(uuid.uuid4().hex, key, export_format)
+            self.jobs[job.job_id] = job
+            self.jobs_by_key[key] = job
+
+        self.executor.submit(self._run, job, data, predictions, insights)
+        return job
+
+    def get(self, job_id):
+        """Mengambil job berdasarkan id, None jika tidak ada atau sudah kedaluwarsa"""
+        with self.lock:
+            self._cleanup_expired()
+            return self.jobs.get(job_id)
+
+    def read_artifact(self, job):
+        """
+        Membaca isi artefak hasil export
+
+        Returns:
+            bytes: Isi artefak, atau None jika file sudah dihapus karena kedaluwarsa
+        """
+        try:
+            with open(job.path, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _run(self, job, data, predictions, insights):
+        """Menjalankan export di thread pekerja"""
+        def progress(value):
+            job.progress = min(max(value, 0.0), 1.0)
+
+        job.started_at = time.time()
+        job.status = 'running'
+        extension = EXPORT_FORMATS[job.export_format]['extension']
+        final_path = os.path.join(self.directory, f"{job.key}.{job.job_id}{extension}")
+        partial_path = os.path.join(self.directory, f"{job.key}.{job.job_id}.part{extension}")
+
+        try:
+            tables = build_report_tables(data, predictions, insights)
+            progress(0.1)
+            WRITERS[job.export_format](tables, partial_path, progress)
+            # Artefak hanya terlihat setelah selesai ditulis
+            os.replace(partial_path, final_path)
+
+            job.path = final_path
+            job.progress = 1.0
+            # finished_at diisi sebelum status agar _cleanup_expired tidak melihat None
+            job.finished_at = time.time()
+            job.status = 'done'
+        except Exception as e:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            job.error = str(e)
+            job.finished_at = time.time()
+            job.status = 'failed'
+
+    def _cleanup_expired(self):
+        """Menghapus job dan artefak yang sudah melewati TTL (dipanggil dengan lock)"""
+        now = time.time()
+        expired = [
+            job for job in self.jobs.values()
+            if job.finished and job.finished_at is not None
+            and now - job.finished_at > self.ttl_seconds
+        ]
+        for job in expired:
+            del self.jobs[job.job_id]
+            if self.jobs_by_key.get(job.key) is job:
+                del self.jobs_by_key[job.key]
+            if job.path and os.path.exists(job.path):
+                os.remove(job.path)
+
+    def shutdown(self):
+        """Menghentikan pekerja dan menghapus folder artefak"""
+        self.executor.shutdown(wait=True)
+        shutil.rmtree(self.directory, ignore_errors=True)
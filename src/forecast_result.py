@@ -0,0 +1,106 @@
+import numpy as np
+
+
+class ForecastResult:
+    """
+    Hasil prediksi ringkas: hanya parameter, state akhir, array forecast,
+    interval, dan metrik. Objek model statsmodels disimpan hanya jika diminta.
+    """
+
+    __slots__ = (
+        'method', 'smoothing_level', 'smoothing_trend', 'level', 'trend',
+        'forecast', 'lower', 'upper', 'mape', 'resid_std', 'n_obs',
+        'fitted_values', 'model'
+    )
+
+    def __init__(self, method, smoothing_level, smoothing_trend, level, trend,
+                 forecast, lower, upper, mape, resid_std, n_obs,
+                 fitted_values=None, model=None):
+        self.method = method
+        self.smoothing_level = smoothing_level
+        self.smoothing_trend = smoothing_trend
+        self.level = level
+        self.trend = trend
+        self.forecast = forecast
+        self.lower = lower
+        self.upper = upper
+        self.mape = mape
+        self.resid_std = resid_std
+        self.n_obs = n_obs
+        self.fitted_values = fitted_values
+        self.model = model
+
+    @classmethod
+    def from_fitted(cls, method, fitted_model, forecast_periods, mape,
+                    z_score=1.96, keep_model=False):
+        """
+        Membuat hasil ringkas dari model statsmodels yang sudah di-fit
+
+        Args:
+            method (str): Nama metode prediksi
+            fitted_model (HoltWintersResults): Model hasil fit
+            forecast_periods (int): Jumlah periode prediksi
+            mape (float): Nilai MAPE dalam persen
+            z_score (float): Z-score untuk confidence interval
+            keep_model (bool): Simpan model dan fitted values lengkap
+
+        Returns:
+            ForecastResult: Hasil prediksi ringkas
+        """
+        forecast = np.asarray(fitted_model.forecast(forecast_periods), dtype=np.float64)
+        resid_std = float(np.std(np.asarray(fitted_model.resid, dtype=np.float64)))
+
+        params = fitted_model.params
+        smoothing_trend = params.get('smoothing_trend')
+        smoothing_trend = np.nan if smoothing_trend is None else float(smoothing_trend)
+        # SES tetap mengembalikan array trend berisi nol; tanpa smoothing_trend
+        # model tidak punya komponen tren, jadi trend dicatat NaN (tidak berlaku)
+        has_trend = not np.isnan(smoothing_trend) and fitted_model.trend is not None
+
+        return cls(
+            method=method,
+            smoothing_level=float(params.get('smoothing_level', np.nan)),
+            smoothing_trend=smoothing_trend,
+            level=float(np.asarray(fitted_model.level)[-1]),
+            trend=float(np.asarray(fitted_model.trend)[-1]) if has_trend else np.nan,
+            forecast=forecast,
+            lower=forecast - z_score * resid_std,
+            upper=forecast + z_score * resid_std,
+            mape=float(mape),
+            resid_std=resid_std,
+            n_obs=len(fitted_model.fittedvalues),
+            fitted_values=fitted_model.fittedvalues if keep_model else None,
+            model=fitted_model if keep_model else None
+        )
+
+    @property
+    def confidence_interval(self):
+        """Batas bawah dan atas confidence interval"""
+        return {'lower': self.lower, 'upper': self.upper}
+
+    @property
+    def nbytes(self):
+        """Perkiraan ukuran array numerik yang disimpan (tanpa model)"""
+        return self.forecast.nbytes + self.lower.nbytes + self.upper.nbytes
+
+    def to_dict(self):
+        """Mengubah hasil menjadi dict (tanpa model) untuk export/serialisasi"""
+        return {
+            'method': self.method,
+            'smoothing_level': self.smoothing_level,
+            'smoothing_trend': self.smoothing_trend,
+            'level': self.level,
+            'trend': self.trend,
+            'forecast': self.forecast.tolist(),
+            'lower': self.lower.tolist(),
+            'upper': self.upper.tolist(),
+            'mape': self.mape,
+            'resid_std': self.resid_std,
+            'n_obs': self.n_obs
+        }
+
+    def __repr__(self):
+        return (
+            f"ForecastResult(method={self.method!r}, forecast={self.forecast.round(2).tolist()}, "
+            f"mape={self.mape:.2f})"
+        )
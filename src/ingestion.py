@@ -0,0 +1,311 @@
+import csv
+import os
+import time
+import pandas as pd
+import numpy as np
+import streamlit as st
+from config import INGESTION_CONFIG, SALES_DATA_COLUMNS, PRODUCT_CATEGORIES
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - pyarrow opsional
+    pa = None
+    pa_csv = None
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - tidak tersedia di Windows
+    resource = None
+
+
+def get_peak_rss_mb():
+    """
+    Mengambil puncak resident set size (RSS) sepanjang umur proses
+
+    Catatan: nilai ini tidak pernah turun, jadi pada server Streamlit bisa
+    berasal dari run lain. Untuk pemakaian memori satu proses ingest, lihat
+    get_current_rss_mb.
+
+    Returns:
+        float: Puncak RSS proses dalam MB, atau NaN jika tidak tersedia
+    """
+    if resource is None:
+        return np.nan
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte
+    if os.uname().sysname == 'Darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def get_current_rss_mb():
+    """
+    Mengambil RSS proses saat ini (Linux, dari /proc/self/statm)
+
+    Returns:
+        float: RSS saat ini dalam MB, atau NaN jika tidak tersedia
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return np.nan
+    return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+class MonthlyAggregator:
+    """Agregasi bulanan streaming dengan jumlah parsial berjalan"""
+
+    group_keys = ['bulan', 'kategori_produk', 'nama_produk']
+    value_columns = ['jumlah_penjualan', 'total_penjualan']
+
+    def __init__(self):
+        self.partial = None
+
+    def add(self, chunk):
+        """
+        Menambahkan satu chunk data harian ke jumlah parsial
+
+        Args:
+            chunk (pd.DataFrame): Chunk yang sudah tervalidasi
+        """
+        if chunk.empty:
+            return
+
+        grouped = chunk.groupby(
+            [chunk['tanggal'].dt.to_period('M').rename('bulan'),
+             'kategori_produk', 'nama_produk'],
+            observed=True, sort=False
+        )[self.value_columns].sum()
+
+        if self.partial is None:
+            self.partial = grouped
+        else:
+            self.partial = self.partial.add(grouped, fill_value=0)
+
+    def result(self):
+        """
+        Menghasilkan data bulanan dengan format yang sama seperti data contoh
+
+        Returns:
+            pd.DataFrame: Data penjualan bulanan per produk
+        """
+        columns = ['tanggal', 'kategori_produk', 'nama_produk',
+                   'jumlah_penjualan', 'harga_satuan', 'total_penjualan']
+        if self.partial is None:
+            return pd.DataFrame(columns=columns)
+
+        monthly = self.partial.reset_index()
+        # Tanggal akhir bulan, konsisten dengan load_sample_data (freq='M')
+        monthly['tanggal'] = monthly['bulan'].dt.end_time.dt.normalize()
+        monthly['jumlah_penjualan'] = monthly['jumlah_penjualan'].astype('int64')
+        monthly['harga_satuan'] = (
+            monthly['total_penjualan']
+            / monthly['jumlah_penjualan'].where(monthly['jumlah_penjualan'] > 0)
+        )
+
+        return monthly[columns].sort_values(
+            ['tanggal', 'kategori_produk', 'nama_produk']
+        ).reset_index(drop=True)
+
+
+class SalesFileIngestor:
+    def __init__(self, chunk_size=None, use_pyarrow=None):
+        """
+        Inisialisasi ingestor file penjualan (CSV/Excel)
+
+        Args:
+            chunk_size (int): Jumlah baris per chunk
+            use_pyarrow (bool): Gunakan pembaca CSV pyarrow jika tersedia
+        """
+        if chunk_size is None:
+            chunk_size = INGESTION_CONFIG['chunk_size']
+        if use_pyarrow is None:
+            use_pyarrow = INGESTION_CONFIG['use_pyarrow']
+
+        self.chunk_size = chunk_size
+        self.use_pyarrow = use_pyarrow and pa_csv is not None
+        self.stats = {}
+
+    def _detect_format(self, source, filename=None):
+        """Menentukan format file dari nama file"""
+        if filename is None:
+            filename = source if isinstance(source, str) else getattr(source, 'name', '')
+
+        extension = os.path.splitext(str(filename))[1].lower()
+        if extension in ('.csv', '.txt'):
+            return 'csv'
+        if extension in ('.xlsx', '.xlsm'):
+            return 'excel'
+        raise ValueError(f"Format file tidak didukung: '{extension or filename}'")
+
+    def _read_csv_chunks(self, source):
+        """Membaca CSV per chunk, memakai pyarrow bila tersedia"""
+        if self.use_pyarrow:
+            # Semua kolom dibaca sebagai string (sesuai nama header asli) agar tipe
+            # tidak berubah antar blok dan satu sel rusak tidak menolak seluruh file;
+            # konversi angka/tanggal dilakukan validate_chunk dengan errors='coerce'
+            column_types = {name: pa.string() for name in self._read_csv_header(source)}
+            reader = pa_csv.open_csv(
+                source,
+                read_options=pa_csv.ReadOptions(block_size=INGESTION_CONFIG['csv_block_size']),
+                convert_options=pa_csv.ConvertOptions(column_types=column_types)
+            )
+            for batch in reader:
+                yield batch.to_pandas()
+        else:
+            for chunk in pd.read_csv(source, chunksize=self.chunk_size):
+                yield chunk
+
+    def _read_csv_header(self, source):
+        """Membaca nama kolom dari baris pertama CSV tanpa memindahkan posisi baca"""
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'r', encoding='utf-8-sig', newline='') as f:
+                line = f.readline()
+        else:
+            position = source.tell()
+            line = source.readline()
+            source.seek(position)
+            if isinstance(line, bytes):
+                line = line.decode('utf-8-sig')
+
+        return next(csv.reader([line]), [])
+
+    def _read_excel_chunks(self, source):
+        """Membaca XLSX baris demi baris dalam mode read-only"""
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(source, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+
+            buffer = []
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) >= self.chunk_size:
+                    yield pd.DataFrame.from_records(buffer, columns=header)
+                    buffer = []
+            if buffer:
+                yield pd.DataFrame.from_records(buffer, columns=header)
+        finally:
+            workbook.close()
+
+    def validate_chunk(self, chunk):
+        """
+        Memvalidasi chunk terhadap skema tabel sales_data
+
+        Args:
+            chunk (pd.DataFrame): Chunk mentah dari file
+
+        Returns:
+            pd.DataFrame: Baris yang valid dengan tipe kolom yang sudah dikonversi
+        """
+        chunk = chunk.rename(columns=lambda c: str(c).strip().lower())
+
+        missing = [col for col in SALES_DATA_COLUMNS if col not in chunk.columns]
+        if missing:
+            raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(missing)}")
+
+        chunk['tanggal'] = pd.to_datetime(
+            chunk['tanggal'], errors='coerce', format=INGESTION_CONFIG['date_format']
+        )
+        chunk['kategori_produk'] = chunk['kategori_produk'].astype('string').str.strip().str.lower()
+        chunk['nama_produk'] = chunk['nama_produk'].astype('string').str.strip()
+        chunk['jumlah_penjualan'] = pd.to_numeric(chunk['jumlah_penjualan'], errors='coerce')
+        chunk['harga_satuan'] = pd.to_numeric(chunk['harga_satuan'], errors='coerce')
+
+        computed_total = chunk['jumlah_penjualan'] * chunk['harga_satuan']
+        if 'total_penjualan' in chunk.columns:
+            chunk['total_penjualan'] = pd.to_numeric(
+                chunk['total_penjualan'], errors='coerce'
+            ).fillna(computed_total)
+        else:
+            chunk['total_penjualan'] = computed_total
+
+        valid = (
+            chunk['tanggal'].notna()
+            & chunk['kategori_produk'].isin(list(PRODUCT_CATEGORIES)).fillna(False)
+            & chunk['nama_produk'].notna()
+            & (chunk['jumlah_penjualan'] >= 0)
+            & (chunk['harga_satuan'] >= 0)
+        )
+
+        self.stats['rows_invalid'] += int((~valid).sum())
+
+        columns = list(SALES_DATA_COLUMNS) + ['total_penjualan']
+        if 'outlet' in chunk.columns:
+            columns.append('outlet')
+
+        clean = chunk.loc[valid, columns]
+        clean['jumlah_penjualan'] = clean['jumlah_penjualan'].astype('int64')
+        clean['kategori_produk'] = clean['kategori_produk'].astype('category')
+        return clean
+
+    def iter_chunks(self, source, filename=None):
+        """
+        Membaca file per chunk dan menghasilkan chunk yang sudah tervalidasi
+
+        Args:
+            source (str | file-like): Path file atau objek file (mis. hasil st.file_uploader)
+            filename (str): Nama file untuk deteksi format jika source tidak memiliki nama
+
+        Yields:
+            pd.DataFrame: Chunk data harian yang valid
+        """
+        file_format = self._detect_format(source, filename)
+        reader = self._read_csv_chunks if file_format == 'csv' else self._read_excel_chunks
+
+        self.stats = {
+            'format': file_format,
+            'chunks': 0,
+            'rows_read': 0,
+            'rows_invalid': 0
+        }
+        for chunk in reader(source):
+            self.stats['chunks'] += 1
+            self.stats['rows_read'] += len(chunk)
+            yield self.validate_chunk(chunk)
+
+    def ingest(self, source, filename=None):
+        """
+        Membaca file, memvalidasi, dan meresample data harian ke bulanan
+
+        Args:
+            source (str | file-like): Path file atau objek file
+            filename (str): Nama file untuk deteksi format
+
+        Returns:
+            pd.DataFrame: Data penjualan bulanan siap untuk prediksi
+        """
+        try:
+            start = time.perf_counter()
+            start_rss = get_current_rss_mb()
+            aggregator = MonthlyAggregator()
+
+            for chunk in self.iter_chunks(source, filename):
+                aggregator.add(chunk)
+
+            monthly = aggregator.result()
+            elapsed = time.perf_counter() - start
+
+            self.stats['rows_valid'] = self.stats['rows_read'] - self.stats['rows_invalid']
+            self.stats['elapsed_seconds'] = elapsed
+            self.stats['rows_per_second'] = self.stats['rows_read'] / elapsed if elapsed > 0 else np.nan
+            # Pertambahan RSS selama ingest ini, plus puncak sepanjang umur proses
+            self.stats['rss_growth_mb'] = get_current_rss_mb() - start_rss
+            self.stats['process_peak_rss_mb'] = get_peak_rss_mb()
+
+            if monthly.empty:
+                st.warning("File tidak berisi baris penjualan yang valid")
+                return None
+
+            return monthly
+
+        except Exception as e:
+            st.error(f"Error dalam membaca file penjualan: {e}")
+            return None
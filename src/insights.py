@@ -0,0 +1,186 @@
+import pandas as pd
+import numpy as np
+from config import PRODUCT_CATEGORIES, INSIGHT_CONFIG
+from trend_stats import compute_trend_table
+
+# Urutan prioritas untuk ranking (sesuai ENUM kolom prioritas tabel insights)
+PRIORITY_RANK = {'high': 0, 'medium': 1, 'low': 2}
+
+INSIGHT_AREAS = ['inventory', 'marketing', 'production', 'financial']
+
+# Aturan insight: 'when' dan 'score' dievaluasi sebagai operasi vektor pada
+# seluruh tabel prediksi, 'template' hanya dirender untuk baris yang ditampilkan
+INSIGHT_RULES = [
+    {
+        'id': 'stok_naik',
+        'area': 'inventory',
+        'prioritas': 'high',
+        'when': lambda t: t['direction'] == 'Naik',
+        'score': lambda t: t['revenue_forecast'],
+        'template': "Tingkatkan stok {label} sebesar 20-30% untuk mengantisipasi peningkatan permintaan"
+    },
+    {
+        'id': 'stok_turun',
+        'area': 'inventory',
+        'prioritas': 'medium',
+        'when': lambda t: t['direction'] == 'Turun',
+        'score': lambda t: t['revenue_forecast'],
+        'template': "Kurangi stok {label} dan fokus pada produk dengan performa lebih baik"
+    },
+    {
+        'id': 'volatilitas_tinggi',
+        'area': 'marketing',
+        'prioritas': 'medium',
+        'when': lambda t: t['volatility'] > INSIGHT_CONFIG['volatility_threshold'],
+        'score': lambda t: t['volatility'] * t['revenue_forecast'],
+        'template': "Implementasikan strategi pemasaran yang lebih agresif untuk {label} karena volatilitas tinggi ({volatility:.1f}%)"
+    },
+    {
+        'id': 'rencana_produksi',
+        'area': 'production',
+        'prioritas': 'high',
+        'when': lambda t: t['avg_forecast'].notna(),
+        'score': lambda t: t['avg_forecast'],
+        'template': "Rencanakan produksi {label} sebesar {avg_forecast:,.0f} unit per bulan untuk {forecast_periods} bulan ke depan"
+    },
+    {
+        'id': 'proyeksi_pendapatan',
+        'area': 'financial',
+        'prioritas': 'high',
+        'when': lambda t: t['revenue_forecast'].notna(),
+        'score': lambda t: t['revenue_forecast'],
+        'template': "Proyeksi pendapatan {label}: Rp {revenue_forecast:,.0f} per bulan (harga rata-rata Rp {harga_satuan:,.0f})"
+    }
+]
+
+
+def compute_unit_prices(data, key_column='kategori_produk'):
+    """
+    Menghitung harga satuan rata-rata tertimbang dari harga_satuan historis
+
+    Args:
+        data (pd.DataFrame): Data penjualan dengan kolom harga_satuan
+        key_column (str): Kolom kunci (kategori_produk atau nama_produk)
+
+    Returns:
+        pd.Series: Harga satuan per kunci
+    """
+    grouped = data.groupby(key_column, observed=True)
+    weighted = grouped['total_penjualan'].sum() / grouped['jumlah_penjualan'].sum().replace(0, np.nan)
+    return weighted.fillna(grouped['harga_satuan'].mean()).rename('harga_satuan')
+
+
+def build_forecast_table(predictions, data, key_column='kategori_produk', trend_table=None):
+    """
+    Menyusun tabel kolumnar dari hasil prediksi, metrik tren, dan harga
+
+    Args:
+        predictions (dict): Hasil perform_prediction per kunci
+        data (pd.DataFrame): Data penjualan historis (sumber harga_satuan)
+        key_column (str): Kolom kunci yang dipakai pada predictions
+        trend_table (pd.DataFrame): Tabel dari compute_trend_table; dihitung dari
+            data jika tidak diberikan
+
+    Returns:
+        pd.DataFrame: Satu baris per seri dengan forecast, tren, dan harga
+    """
+    records = []
+    for key, pred_data in predictions.items():
+        if not pred_data or not pred_data['holt']:
+            continue
+        forecast = pred_data['holt'].forecast
+        records.append({
+            'key': key,
+            'label': PRODUCT_CATEGORIES.get(key, key),
+            'avg_forecast': forecast.mean(),
+            'forecast_periods': len(forecast)
+        })
+
+    if trend_table is None:
+        trend_table = compute_trend_table(data, key_column)
+
+    table = pd.DataFrame.from_records(records, columns=[
+        'key', 'label', 'avg_forecast', 'forecast_periods'
+    ])
+    table = table.merge(
+        trend_table[['key', 'direction', 'strength', 'volatility', 'avg_change']],
+        on='key', how='left'
+    )
+    table = table.join(compute_unit_prices(data, key_column), on='key')
+    table['revenue_forecast'] = table['avg_forecast'] * table['harga_satuan']
+    return table
+
+
+def evaluate_rules(table, rules=None):
+    """
+    Mengevaluasi semua aturan sebagai mask vektor tanpa merender teks
+
+    Args:
+        table (pd.DataFrame): Tabel dari build_forecast_table
+        rules (list): Daftar aturan, default INSIGHT_RULES
+
+    Returns:
+        pd.DataFrame: Satu baris per insight yang terpicu (rule, area, prioritas, row, score)
+    """
+    if rules is None:
+        rules = INSIGHT_RULES
+
+    hits = []
+    for rule_index, rule in enumerate(rules):
+        mask = rule['when'](table).fillna(False).to_numpy(dtype=bool)
+        if not mask.any():
+            continue
+        rows = np.flatnonzero(mask)
+        hits.append(pd.DataFrame({
+            'rule': rule_index,
+            'area': rule['area'],
+            'prioritas': rule['prioritas'],
+            'row': rows,
+            'score': rule['score'](table).to_numpy(dtype=float)[rows]
+        }))
+
+    if not hits:
+        return pd.DataFrame(columns=['rule', 'area', 'prioritas', 'row', 'score'])
+    return pd.concat(hits, ignore_index=True)
+
+
+def rank_insights(hits, top_n=None):
+    """
+    Mengurutkan insight berdasarkan prioritas lalu skor, opsional top-N per area
+
+    Args:
+        hits (pd.DataFrame): Hasil evaluate_rules
+        top_n (int): Jumlah insight teratas per area (None = semua)
+
+    Returns:
+        pd.DataFrame: Insight terurut
+    """
+    ranked = hits.assign(
+        _rank=hits['prioritas'].map(PRIORITY_RANK)
+    ).sort_values(['_rank', 'score'], ascending=[True, False], kind='stable')
+
+    if top_n is not None:
+        ranked = ranked.groupby('area', sort=False).head(top_n)
+    return ranked.drop(columns='_rank')
+
+
+def render_insights(hits, table, rules=None):
+    """
+    Merender teks insight hanya untuk baris yang diberikan
+
+    Args:
+        hits (pd.DataFrame): Insight terpilih (hasil rank_insights)
+        table (pd.DataFrame): Tabel dari build_forecast_table
+        rules (list): Daftar aturan, default INSIGHT_RULES
+
+    Returns:
+        dict: Daftar teks insight per area
+    """
+    if rules is None:
+        rules = INSIGHT_RULES
+
+    insights = {area: [] for area in INSIGHT_AREAS}
+    for rule_index, area, row in zip(hits['rule'], hits['area'], hits['row']):
+        values = table.iloc[row].to_dict()
+        insights[area].append(rules[rule_index]['template'].format(**values))
+    return insights
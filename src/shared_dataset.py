@@ -0,0 +1,379 @@
+import argparse
+import json
+import os
+import time
+import uuid
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+import pandas as pd
+import numpy as np
+from config import SHARED_DATA_CONFIG
+from trend_stats import build_series_matrix
+
+MANIFEST_FILE = 'manifest.json'
+
+
+def _manifest_path(manifest_dir):
+    return os.path.join(manifest_dir, MANIFEST_FILE)
+
+
+def read_manifest(manifest_dir=None):
+    """
+    Membaca manifest dataset bersama versi terbaru
+
+    Returns:
+        dict: Isi manifest, atau None jika belum ada dataset yang dipublikasikan
+    """
+    if manifest_dir is None:
+        manifest_dir = SHARED_DATA_CONFIG['manifest_dir']
+    try:
+        with open(_manifest_path(manifest_dir), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+# Blok yang dibuat publisher di proses ini (ikut terwarisi oleh pekerja hasil fork)
+_published_blocks = set()
+
+
+def _open_block(name):
+    """Membuka blok shared memory tanpa didaftarkan ke resource tracker proses ini"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 tidak punya track=False; tanpa unregister tracker akan
+        # meng-unlink blok milik publisher saat proses pembaca keluar. Blok milik
+        # publisher di proses yang sama tidak di-unregister karena tracker-nya
+        # dipakai bersama dan publisher sendiri yang meng-unlink
+        block = shared_memory.SharedMemory(name=name)
+        if os.name == 'posix' and block.name not in _published_blocks:
+            resource_tracker.unregister(block._name, 'shared_memory')
+        return block
+
+
+class SharedDatasetPublisher:
+    """Memuat data sekali lalu mempublikasikannya ke shared memory dengan versi"""
+
+    def __init__(self, manifest_dir=None, name_prefix=None):
+        """
+        Args:
+            manifest_dir (str): Folder manifest yang dibaca proses lain
+            name_prefix (str): Awalan nama blok shared memory
+        """
+        if manifest_dir is None:
+            manifest_dir = SHARED_DATA_CONFIG['manifest_dir']
+        if name_prefix is None:
+            name_prefix = SHARED_DATA_CONFIG['name_prefix']
+
+        os.makedirs(manifest_dir, exist_ok=True)
+        self.manifest_dir = manifest_dir
+        self.name_prefix = name_prefix
+        self.blocks = []
+        self.version = 0
+
+        current = read_manifest(manifest_dir)
+        if current is not None:
+            self.version = current['version']
+
+    def publish(self, data):
+        """
+        Mempublikasikan data penjualan sebagai versi baru
+
+        Args:
+            data (pd.DataFrame): Data penjualan format sales_data
+
+        Returns:
+            int: Nomor versi yang dipublikasikan
+        """
+        matrix, keys, dates = build_series_matrix(data)
+
+        kategori = pd.Categorical(data['kategori_produk'].astype(str))
+        produk = pd.Categorical(data['nama_produk'].astype(str))
+
+        arrays = {
+            'matrix': matrix,
+            'tanggal': pd.to_datetime(data['tanggal']).to_numpy(dtype='datetime64[ns]').view(np.int64),
+            'kategori_produk': kategori.codes,
+            'nama_produk': produk.codes,
+            'jumlah_penjualan': data['jumlah_penjualan'].to_numpy(dtype=np.int64),
+            'harga_satuan': data['harga_satuan'].to_numpy(dtype=np.float64),
+            'total_penjualan': data['total_penjualan'].to_numpy(dtype=np.float64)
+        }
+        metadata = {
+            'keys': [str(key) for key in keys],
+            'dates': [str(date) for date in pd.DatetimeIndex(dates)],
+            'categories': {
+                'kategori_produk': kategori.categories.tolist(),
+                'nama_produk': produk.categories.tolist()
+            }
+        }
+
+        return self.publish_arrays(arrays, metadata)
+
+    def publish_arrays(self, arrays, metadata=None):
+        """
+        Menyalin array ke blok shared memory baru dan menukar manifest secara atomik
+
+        Args:
+            arrays (dict): Nama -> np.ndarray numerik
+            metadata (dict): Metadata JSON yang disertakan di manifest
+
+        Returns:
+            int: Nomor versi yang dipublikasikan
+        """
+        version = self.version + 1
+        token = uuid.uuid4().hex[:8]
+        new_blocks = []
+        entries = {}
+
+        try:
+            for name, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                block = shared_memory.SharedMemory(
+                    name=f"{self.name_prefix}_v{version}_{token}_{name}",
+                    create=True,
+                    size=max(array.nbytes, 1)
+                )
+                new_blocks.append(block)
+                _published_blocks.add(block.name)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                entries[name] = {
+                    'shm': block.name,
+                    'shape': list(array.shape),
+                    'dtype': array.dtype.str
+                }
+        except Exception:
+            for block in new_blocks:
+                block.close()
+                block.unlink()
+                _published_blocks.discard(block.name)
+            raise
+
+        manifest = {
+            'version': version,
+            'created_at': time.time(),
+            'arrays': entries,
+            'metadata': metadata or {}
+        }
+        tmp_path = f"{_manifest_path(self.manifest_dir)}.{token}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, _manifest_path(self.manifest_dir))
+
+        # Versi lama di-unlink: pembaca yang sudah attach tetap valid sampai close()
+        self._release(self.blocks)
+        self.blocks = new_blocks
+        self.version = version
+        return version
+
+    def _release(self, blocks):
+        for block in blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+            _published_blocks.discard(block.name)
+
+    def close(self):
+        """Menghapus versi yang sedang dipublikasikan beserta manifest-nya"""
+        self._release(self.blocks)
+        self.blocks = []
+        manifest = read_manifest(self.manifest_dir)
+        if manifest is not None and manifest['version'] == self.version:
+            os.remove(_manifest_path(self.manifest_dir))
+
+
+class SharedSalesDataset:
+    """Akses read-only zero-copy ke dataset yang dipublikasikan SharedDatasetPublisher"""
+
+    def __init__(self, manifest, arrays):
+        self.manifest = manifest
+        self.arrays = arrays
+
+    @classmethod
+    def attach(cls, manifest_dir=None):
+        """
+        Attach ke versi terbaru sebagai view NumPy read-only
+
+        Returns:
+            SharedSalesDataset: Dataset bersama, atau None jika belum dipublikasikan
+        """
+        manifest = read_manifest(manifest_dir)
+        if manifest is None:
+            return None
+
+        arrays = {}
+        try:
+            for name, entry in manifest['arrays'].items():
+                block = _open_block(entry['shm'])
+                view = np.ndarray(tuple(entry['shape']), dtype=np.dtype(entry['dtype']), buffer=block.buf)
+                view.flags.writeable = False
+                # Blok baru di-unmap setelah view dasar ini (dan semua view/frame
+                # turunannya, yang mereferensikan view ini sebagai base) tidak dipakai lagi
+                weakref.finalize(view, block.close)
+                arrays[name] = view
+        except FileNotFoundError:
+            # Manifest tertukar saat attach; blok yang sempat dibuka ditutup lewat finalizer
+            return None
+
+        return cls(manifest, arrays)
+
+    @property
+    def version(self):
+        return self.manifest['version']
+
+    @property
+    def matrix(self):
+        """Matriks penjualan bulanan seri x periode"""
+        return self.arrays['matrix']
+
+    @property
+    def keys(self):
+        return self.manifest['metadata'].get('keys', [])
+
+    @property
+    def dates(self):
+        return pd.DatetimeIndex(self.manifest['metadata'].get('dates', []))
+
+    def is_stale(self, manifest_dir=None):
+        """True jika publisher sudah mempublikasikan versi yang lebih baru"""
+        manifest = read_manifest(manifest_dir)
+        return manifest is None or manifest['version'] != self.version
+
+    def refresh(self, manifest_dir=None):
+        """
+        Beralih ke versi terbaru jika ada
+
+        Returns:
+            SharedSalesDataset: Dataset versi terbaru (self jika tidak berubah)
+        """
+        if not self.is_stale(manifest_dir):
+            return self
+        latest = SharedSalesDataset.attach(manifest_dir)
+        if latest is None:
+            return self
+        self.close()
+        return latest
+
+    def series(self, row):
+        """Satu seri bulanan sebagai pd.Series (view, tanpa salinan data)"""
+        return pd.Series(self.matrix[row], index=self.dates, name=self.keys[row], copy=False)
+
+    def to_frame(self):
+        """
+        Menyusun DataFrame format sales_data dari kolom bersama
+
+        Returns:
+            pd.DataFrame: Data penjualan
+        """
+        categories = self.manifest['metadata']['categories']
+        return pd.DataFrame({
+            'tanggal': self.arrays['tanggal'].view('datetime64[ns]'),
+            'kategori_produk': pd.Categorical.from_codes(
+                self.arrays['kategori_produk'], categories['kategori_produk']
+            ),
+            'nama_produk': pd.Categorical.from_codes(
+                self.arrays['nama_produk'], categories['nama_produk']
+            ),
+            'jumlah_penjualan': self.arrays['jumlah_penjualan'],
+            'harga_satuan': self.arrays['harga_satuan'],
+            'total_penjualan': self.arrays['total_penjualan']
+        }, copy=False)
+
+    def close(self):
+        """
+        Melepas referensi dataset ke view (tidak menghapus data milik publisher)
+
+        Blok tidak langsung di-unmap: frame dari to_frame() atau series() yang masih
+        dipakai sesi/job lain tetap valid, dan blok ditutup setelah semuanya dilepas.
+        """
+        self.arrays = {}
+
+
+# State per proses pekerja untuk forecast paralel
+_worker_dataset = None
+
+
+def _init_forecast_worker(manifest_dir):
+    global _worker_dataset
+    _worker_dataset = SharedSalesDataset.attach(manifest_dir)
+
+
+def _forecast_row(row, expected_version):
+    """Menjalankan Holt untuk satu baris matriks bersama (di proses pekerja)"""
+    from time_series import TimeSeriesAnalyzer
+
+    if _worker_dataset is None or _worker_dataset.version != expected_version:
+        raise RuntimeError("Versi dataset bersama berubah selama forecast")
+
+    series = _worker_dataset.series(row).dropna()
+    analyzer = TimeSeriesAnalyzer(pd.DataFrame({
+        'tanggal': series.index,
+        'jumlah_penjualan': series.to_numpy()
+    }))
+    if not analyzer.prepare_data():
+        return row, None
+    return row, analyzer.holt_linear_trend()
+
+
+def forecast_shared_series(dataset, rows=None, max_workers=None, manifest_dir=None):
+    """
+    Forecast Holt paralel; pekerja membaca input langsung dari shared memory
+
+    Args:
+        dataset (SharedSalesDataset): Dataset yang sudah di-attach
+        rows (list): Indeks baris matriks, default semua seri
+        max_workers (int): Jumlah proses pekerja
+        manifest_dir (str): Folder manifest
+
+    Returns:
+        dict: Kunci seri -> ForecastResult
+    """
+    if rows is None:
+        rows = range(dataset.matrix.shape[0])
+
+    results = {}
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_forecast_worker,
+        initargs=(manifest_dir,)
+    ) as executor:
+        futures = [executor.submit(_forecast_row, row, dataset.version) for row in rows]
+        for future in futures:
+            row, result = future.result()
+            results[dataset.keys[row]] = result
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publikasikan data penjualan ke shared memory")
+    parser.add_argument('file', help='File CSV/XLSX penjualan harian')
+    parser.add_argument('--interval', type=int, default=0,
+                        help='Muat ulang dan publikasikan versi baru setiap N detik (0 = sekali)')
+    args = parser.parse_args()
+
+    from ingestion import SalesFileIngestor
+
+    publisher = SharedDatasetPublisher()
+    try:
+        while True:
+            data = SalesFileIngestor().ingest(args.file)
+            if data is None:
+                raise SystemExit(f"Gagal memuat {args.file}")
+
+            version = publisher.publish(data)
+            print(f"Versi {version} dipublikasikan ke {publisher.manifest_dir}")
+
+            # Blok shared memory hidup selama proses publisher berjalan
+            time.sleep(args.interval if args.interval > 0 else 10 ** 9)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        publisher.close()
+
+
+if __name__ == '__main__':
+    main()
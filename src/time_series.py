@@ -5,6 +5,7 @@ from statsmodels.tsa.seasonal import seasonal_decompose
 import streamlit as st
 from datetime import datetime, timedelta
 from config import PREDICTION_CONFIG
+from forecast_result import ForecastResult
 
 class TimeSeriesAnalyzer:
     def __init__(self, data):
@@ -38,15 +39,16 @@ class TimeSeriesAnalyzer:
             st.error(f"Error dalam mempersiapkan data: {e}")
             return False
     
-    def simple_exponential_smoothing(self, smoothing_level=None):
+    def simple_exponential_smoothing(self, smoothing_level=None, keep_model=False):
         """
         Melakukan prediksi menggunakan Simple Exponential Smoothing
         
         Args:
             smoothing_level (float): Level smoothing (alpha)
+            keep_model (bool): Simpan objek model statsmodels lengkap
             
         Returns:
-            dict: Hasil prediksi dan metrik
+            ForecastResult: Hasil prediksi dan metrik
         """
         try:
             if smoothing_level is None:
@@ -56,45 +58,34 @@ class TimeSeriesAnalyzer:
             model = SimpleExpSmoothing(self.series, initialization_method="estimated")
             fitted_model = model.fit(smoothing_level=smoothing_level)
             
-            # Prediksi
-            forecast = fitted_model.forecast(self.forecast_periods)
-            
-            # Hitung confidence interval (estimasi sederhana)
-            residuals = fitted_model.resid
-            std_error = np.std(residuals)
-            z_score = 1.96  # untuk 95% confidence interval
-            
-            confidence_interval = {
-                'lower': forecast - (z_score * std_error),
-                'upper': forecast + (z_score * std_error)
-            }
-            
             # Hitung MAPE
             mape = self.calculate_mape(self.series, fitted_model.fittedvalues)
             
-            return {
-                'method': 'Simple Exponential Smoothing',
-                'forecast': forecast,
-                'confidence_interval': confidence_interval,
-                'mape': mape,
-                'fitted_values': fitted_model.fittedvalues,
-                'model': fitted_model
-            }
+            # Prediksi dan confidence interval, model lengkap hanya jika diminta
+            return ForecastResult.from_fitted(
+                'Simple Exponential Smoothing',
+                fitted_model,
+                self.forecast_periods,
+                mape,
+                z_score=1.96,  # untuk 95% confidence interval
+                keep_model=keep_model
+            )
             
         except Exception as e:
             st.error(f"Error dalam Simple Exponential Smoothing: {e}")
             return None
     
-    def holt_linear_trend(self, smoothing_level=None, trend_level=None):
+    def holt_linear_trend(self, smoothing_level=None, trend_level=None, keep_model=False):
         """
         Melakukan prediksi menggunakan Holt's Linear Trend
         
         Args:
             smoothing_level (float): Level smoothing (alpha)
             trend_level (float): Trend smoothing (beta)
+            keep_model (bool): Simpan objek model statsmodels lengkap
             
         Returns:
-            dict: Hasil prediksi dan metrik
+            ForecastResult: Hasil prediksi dan metrik
         """
         try:
             if smoothing_level is None:
@@ -109,30 +100,18 @@ class TimeSeriesAnalyzer:
                 smoothing_trend=trend_level
             )
             
-            # Prediksi
-            forecast = fitted_model.forecast(self.forecast_periods)
-            
-            # Hitung confidence interval
-            residuals = fitted_model.resid
-            std_error = np.std(residuals)
-            z_score = 1.96  # untuk 95% confidence interval
-            
-            confidence_interval = {
-                'lower': forecast - (z_score * std_error),
-                'upper': forecast + (z_score * std_error)
-            }
-            
             # Hitung MAPE
             mape = self.calculate_mape(self.series, fitted_model.fittedvalues)
             
-            return {
-                'method': 'Holt Linear Trend',
-                'forecast': forecast,
-                'confidence_interval': confidence_interval,
-                'mape': mape,
-                'fitted_values': fitted_model.fittedvalues,
-                'model': fitted_model
-            }
+            # Prediksi dan confidence interval, model lengkap hanya jika diminta
+            return ForecastResult.from_fitted(
+                'Holt Linear Trend',
+                fitted_model,
+                self.forecast_periods,
+                mape,
+                z_score=1.96,  # untuk 95% confidence interval
+                keep_model=keep_model
+            )
             
         except Exception as e:
             st.error(f"Error dalam Holt Linear Trend: {e}")
@@ -258,4 +237,3 @@ class TimeSeriesAnalyzer:
         except Exception as e:
             st.error(f"Error dalam analisis tren: {e}")
             return None
-
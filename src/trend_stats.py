@@ -0,0 +1,206 @@
+import pandas as pd
+import numpy as np
+
+
+def build_series_matrix(data, key_column='kategori_produk', date_column='tanggal',
+                        value_column='jumlah_penjualan'):
+    """
+    Menyusun matriks 2-D (seri x periode) dari data penjualan format panjang
+
+    Args:
+        data (pd.DataFrame): Data penjualan
+        key_column (str): Kolom identitas seri (kategori_produk atau nama_produk)
+        date_column (str): Kolom tanggal
+        value_column (str): Kolom nilai
+
+    Returns:
+        tuple: (matriks float, daftar kunci seri, index tanggal)
+    """
+    pivot = data.pivot_table(
+        index=key_column,
+        columns=date_column,
+        values=value_column,
+        aggfunc='sum',
+        observed=True
+    ).sort_index(axis=1)
+
+    return pivot.to_numpy(dtype=float), pivot.index.tolist(), pivot.columns
+
+
+def build_history_matrix(data, key_column='kategori_produk', date_column='tanggal',
+                         value_column='jumlah_penjualan'):
+    """
+    Menyusun matriks seri x periode dari histori tiap seri, rata kiri tanpa celah
+
+    Agregasinya sama dengan perform_prediction (jumlah per tanggal per kunci, urut
+    tanggal): baris i berisi histori seri i dan hanya diisi NaN di ujung kanan,
+    sehingga perubahan antar periode sama dengan series.diff() per seri.
+
+    Returns:
+        tuple: (matriks float, daftar kunci seri)
+    """
+    totals = data.groupby([key_column, date_column], observed=True)[value_column].sum().sort_index()
+    if totals.empty:
+        return np.empty((0, 0)), []
+
+    codes, keys = pd.factorize(totals.index.get_level_values(0))
+    positions = totals.groupby(level=0, observed=True).cumcount().to_numpy()
+
+    matrix = np.full((len(keys), positions.max() + 1), np.nan)
+    matrix[codes, positions] = totals.to_numpy(dtype=float)
+    return matrix, keys.tolist()
+
+
+class RunningTrendStats:
+    """Akumulator tren dan volatilitas bergaya Welford untuk banyak seri sekaligus"""
+
+    def __init__(self, keys):
+        """
+        Inisialisasi akumulator kosong
+
+        Args:
+            keys (list): Kunci seri, satu per baris matriks
+        """
+        self.keys = list(keys)
+        n_series = len(self.keys)
+
+        self.count = np.zeros(n_series, dtype=np.int64)
+        self.mean = np.zeros(n_series)
+        self.m2 = np.zeros(n_series)
+        self.min_value = np.full(n_series, np.nan)
+        self.max_value = np.full(n_series, np.nan)
+
+        # Rata-rata perubahan antar periode (setara diff().dropna().mean())
+        self.change_count = np.zeros(n_series, dtype=np.int64)
+        self.change_mean = np.zeros(n_series)
+        self.previous = np.full(n_series, np.nan)
+
+    def update(self, values):
+        """
+        Menambahkan satu periode baru (mis. satu bulan) untuk semua seri
+
+        Args:
+            values (array-like): Nilai periode baru, NaN untuk seri tanpa data
+
+        Returns:
+            RunningTrendStats: self, agar bisa dirangkai
+        """
+        values = np.asarray(values, dtype=float)
+        valid = ~np.isnan(values)
+
+        # Welford: mean dan M2 berjalan
+        self.count += valid
+        delta = np.where(valid, values - self.mean, 0.0)
+        safe_count = np.maximum(self.count, 1)
+        self.mean += delta / safe_count
+        self.m2 += delta * np.where(valid, values - self.mean, 0.0)
+
+        self.min_value = np.fmin(self.min_value, values)
+        self.max_value = np.fmax(self.max_value, values)
+
+        # Perubahan hanya dihitung jika periode sebelumnya juga valid
+        has_change = valid & ~np.isnan(self.previous)
+        self.change_count += has_change
+        change_delta = np.where(has_change, values - self.previous - self.change_mean, 0.0)
+        self.change_mean += change_delta / np.maximum(self.change_count, 1)
+
+        self.previous = values
+        return self
+
+    def update_many(self, matrix):
+        """
+        Menambahkan beberapa periode sekaligus
+
+        Args:
+            matrix (np.ndarray): Matriks seri x periode
+
+        Returns:
+            RunningTrendStats: self
+        """
+        matrix = np.asarray(matrix, dtype=float)
+        for column in range(matrix.shape[1]):
+            self.update(matrix[:, column])
+        return self
+
+    @property
+    def std(self):
+        """Standar deviasi sampel (ddof=1, sama seperti pandas)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+    @property
+    def avg_change(self):
+        """Rata-rata perubahan antar periode"""
+        return np.where(self.change_count > 0, self.change_mean, np.nan)
+
+    def to_frame(self):
+        """
+        Menghasilkan tabel statistik tren yang rapi (satu baris per seri)
+
+        Returns:
+            pd.DataFrame: Kolom key, direction, strength, avg_change, volatility,
+                min_value, max_value, mean_value, std, count
+        """
+        std = self.std
+        avg_change = self.avg_change
+        mean_value = np.where(self.count > 0, self.mean, np.nan)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            volatility = std / mean_value * 100
+
+        direction = np.select(
+            [avg_change > 0, avg_change < 0],
+            ['Naik', 'Turun'],
+            default='Stabil'
+        )
+        strength = np.where(
+            direction == 'Stabil',
+            'Netral',
+            np.where(np.abs(avg_change) > std, 'Kuat', 'Lemah')
+        )
+
+        return pd.DataFrame({
+            'key': self.keys,
+            'direction': direction,
+            'strength': strength,
+            'avg_change': avg_change,
+            'volatility': volatility,
+            'min_value': self.min_value,
+            'max_value': self.max_value,
+            'mean_value': mean_value,
+            'std': std,
+            'count': self.count
+        })
+
+
+def compute_trend_statistics(matrix, keys=None):
+    """
+    Menghitung statistik tren untuk semua seri dalam satu kali lintasan
+
+    Args:
+        matrix (np.ndarray): Matriks seri x periode
+        keys (list): Kunci seri, default nomor baris
+
+    Returns:
+        pd.DataFrame: Tabel statistik tren (lihat RunningTrendStats.to_frame)
+    """
+    matrix = np.atleast_2d(np.asarray(matrix, dtype=float))
+    if keys is None:
+        keys = range(matrix.shape[0])
+
+    return RunningTrendStats(keys).update_many(matrix).to_frame()
+
+
+def compute_trend_table(data, key_column='kategori_produk'):
+    """
+    Menghitung tabel statistik tren untuk semua seri dalam data sekaligus
+
+    Args:
+        data (pd.DataFrame): Data penjualan
+        key_column (str): Kolom identitas seri
+
+    Returns:
+        pd.DataFrame: Tabel statistik tren dengan kolom key untuk join
+    """
+    matrix, keys = build_history_matrix(data, key_column)
+    return compute_trend_statistics(matrix, keys)